@@ -22,20 +22,7 @@ from __future__ import annotations
 import sys
 import optparse
 import codecs
-import warnings
 import markdown
-try:
-    # We use `unsafe_load` because users may need to pass in actual Python
-    # objects. As this is only available from the CLI, the user has much
-    # worse problems if an attacker can use this as an attach vector.
-    from yaml import unsafe_load as yaml_load
-except ImportError:  # pragma: no cover
-    try:
-        # Fall back to PyYAML <5.1
-        from yaml import load as yaml_load
-    except ImportError:
-        # Fall back to JSON
-        from json import load as yaml_load
 
 import logging
 from logging import DEBUG, WARNING, CRITICAL
@@ -43,6 +30,30 @@ from logging import DEBUG, WARNING, CRITICAL
 logger = logging.getLogger('MARKDOWN')
 
 
+def _load_config(fp):
+    """
+    Load extension configs from the file object `fp`.
+
+    The YAML library is only imported when a config file is actually passed in,
+    as importing it adds noticeably to the start up time of the command.
+    """
+    try:
+        import yaml
+    except ImportError:  # pragma: no cover
+        # Fall back to JSON
+        from json import load
+        return load(fp)
+    # We use an unsafe loader because users may need to pass in actual Python
+    # objects. As this is only available from the CLI, the user has much
+    # worse problems if an attacker can use this as an attach vector.
+    # The `libyaml` bindings are much faster than the pure Python loader.
+    Loader = getattr(yaml, 'CUnsafeLoader', None) or getattr(yaml, 'UnsafeLoader', None)
+    if Loader is None:  # pragma: no cover
+        # Fall back to PyYAML <5.1, where `Loader` is the unsafe loader
+        Loader = getattr(yaml, 'CLoader', yaml.Loader)
+    return yaml.load(fp, Loader=Loader)
+
+
 def parse_options(args=None, values=None):
     """
     Define and parse `optparse` options for command-line usage.
@@ -104,7 +115,7 @@ def parse_options(args=None, values=None):
             options.configfile, mode="r", encoding=options.encoding
         ) as fp:
             try:
-                extension_configs = yaml_load(fp)
+                extension_configs = _load_config(fp)
             except Exception as e:
                 message = "Failed parsing extension config file: %s" % \
                           options.configfile
@@ -135,6 +146,7 @@ def run():  # pragma: no cover
     console_handler = logging.StreamHandler()
     logger.addHandler(console_handler)
     if logging_level <= WARNING:
+        import warnings
         # Ensure deprecation warnings get displayed
         warnings.filterwarnings('default')
         logging.captureWarnings(True)
@@ -417,11 +417,13 @@ class Markdown:
         # Read the source
         if input:
             if isinstance(input, str):
-                input_file = codecs.open(input, mode="r", encoding=encoding)
+                # Read the whole file in one go and decode it at once.
+                with open(input, mode="rb") as input_file:
+                    text = input_file.read().decode(encoding)
             else:
                 input_file = codecs.getreader(encoding)(input)
-            text = input_file.read()
-            input_file.close()
+                text = input_file.read()
+                input_file.close()
         else:
             text = sys.stdin.read()
 
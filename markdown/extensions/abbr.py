@@ -27,7 +27,8 @@ from ..blockprocessors import BlockProcessor
 from ..inlinepatterns import InlineProcessor
 from ..treeprocessors import Treeprocessor
 from ..util import AtomicString, deprecated
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
 import re
 import xml.etree.ElementTree as etree
 
@@ -78,50 +79,153 @@ class AbbrExtension(Extension):
         md.parser.blockprocessors.register(AbbrBlockprocessor(md.parser, self.abbrs), 'abbr', 16)
 
 
+_MAX_TRIE_NESTING = 100
+""" Nesting depth of groups above which `_build_trie_pattern` falls back to a flat alternation. """
+
+
+def _build_trie_pattern(words: Iterable[str]) -> str:
+    """
+    Return a regular expression which matches any of `words`.
+
+    Rather than a flat alternation of every word, the words are merged into a trie so
+    that common prefixes are only tested once. Longer words are always tried before
+    any shorter words they extend, matching the behavior of an alternation sorted by length.
+
+    Each word which is a prefix of another nests a group. As the regular expression parser
+    recurses into nested groups, a flat alternation sorted by length is returned instead
+    if the nesting would exceed `_MAX_TRIE_NESTING`.
+    """
+    words = list(words)
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None
+    pattern, nesting = _trie_to_pattern(trie)
+    if nesting > _MAX_TRIE_NESTING:
+        return '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+    return pattern
+
+
+def _trie_to_pattern(root: dict) -> tuple[str, int]:
+    """
+    Convert a trie built by `_build_trie_pattern` into a regular expression.
+
+    Returns the pattern and the nesting depth of its groups. The trie is walked with an
+    explicit stack, so long words do not exhaust the Python stack.
+    """
+    # Map the `id` of each finished node to its pattern and nesting depth.
+    results: dict[int, tuple[str, int]] = {}
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for char, child in node.items() if char)
+            continue
+        branches = []
+        nesting = 0
+        for char, child in node.items():
+            if char:
+                pattern, child_nesting = results.pop(id(child))
+                branches.append(re.escape(char) + pattern)
+                nesting = max(nesting, child_nesting)
+        if not branches:
+            results[id(node)] = ('', 0)
+        elif len(branches) == 1 and '' not in node:
+            results[id(node)] = (branches[0], nesting)
+        else:
+            pattern = f"(?:{'|'.join(branches)})"
+            if '' in node:
+                # A word ends here, so the remainder is optional.
+                pattern += '?'
+            results[id(node)] = (pattern, nesting + 1)
+    return results[id(root)]
+
+
+@lru_cache(maxsize=32)
+def _compile_abbr_re(abbrs: frozenset[str]) -> re.Pattern[str]:
+    """
+    Return a compiled regular expression which matches any of `abbrs` as a whole word.
+
+    The result is cached so that documents and `Markdown` instances which share a
+    glossary only compile it once.
+    """
+    return re.compile(f"\\b(?:{_build_trie_pattern(abbrs)})\\b")
+
+
 class AbbrTreeprocessor(Treeprocessor):
     """ Replace abbreviation text with `<abbr>` elements. """
 
     def __init__(self, md: Markdown | None = None, abbrs: dict | None = None):
         self.abbrs: dict = abbrs if abbrs is not None else {}
         self.RE: re.RegexObject | None = None
+        self._first_chars: frozenset[str] | None = None
         super().__init__(md)
 
     def create_element(self, title: str, text: str, tail: str) -> etree.Element:
         ''' Create an `abbr` element. '''
-        abbr = etree.Element('abbr', {'title': title})
+        abbr = etree.Element('abbr')
+        abbr.set('title', title)
         abbr.text = AtomicString(text)
         abbr.tail = tail
         return abbr
 
+    def wrap_abbrs(self, text: str) -> tuple[str, list[etree.Element]]:
+        '''
+        Find all abbreviations in `text` and wrap each in an `abbr` element.
+
+        Returns the text before the first abbreviation and a list of `abbr` elements. The tail of each
+        element holds the text between it and the next abbreviation.
+        '''
+        if self._first_chars is not None and self._first_chars.isdisjoint(text):
+            return text, []
+        abbrs = self.abbrs
+        matches = [(m.start(), m.end(), abbrs[m.group(0)]) for m in self.RE.finditer(text)]
+        # Ignore abbreviations without a definition.
+        matches = [match for match in matches if match[2]]
+        elements = []
+        for i, (start, end, title) in enumerate(matches):
+            next_start = matches[i + 1][0] if i + 1 < len(matches) else len(text)
+            elements.append(self.create_element(title, text[start:end], text[end:next_start]))
+        return (text[:matches[0][0]] if matches else text), elements
+
     def iter_element(self, el: etree.Element, parent: etree.Element | None = None) -> None:
-        ''' Recursively iterate over elements, run regex on text and wrap matches in `abbr` tags. '''
-        for child in reversed(el):
-            self.iter_element(child, el)
-        if text := el.text:
-            for m in reversed(list(self.RE.finditer(text))):
-                if self.abbrs[m.group(0)]:
-                    abbr = self.create_element(self.abbrs[m.group(0)], m.group(0), text[m.end():])
-                    el.insert(0, abbr)
-                    text = text[:m.start()]
-            el.text = text
-        if parent is not None and el.tail:
-            tail = el.tail
-            index = list(parent).index(el) + 1
-            for m in reversed(list(self.RE.finditer(tail))):
-                abbr = self.create_element(self.abbrs[m.group(0)], m.group(0), tail[m.end():])
-                parent.insert(index, abbr)
-                tail = tail[:m.start()]
-            el.tail = tail
+        ''' Iterate over elements, run regex on text and wrap matches in `abbr` tags. '''
+        # Walk the tree with an explicit stack rather than recursion. Each element is
+        # expanded once to queue its children and then handled after all of them, so
+        # the children of an element are processed last to first before the element
+        # itself. Therefore, inserting an `abbr` never shifts an unprocessed element
+        # and the index of each child within its parent remains valid.
+        index = list(parent).index(el) if parent is not None else 0
+        stack: list[tuple[etree.Element, etree.Element | None, int, bool]] = [(el, parent, index, False)]
+        while stack:
+            el, parent, index, expanded = stack.pop()
+            if not expanded:
+                stack.append((el, parent, index, True))
+                stack.extend((child, el, i, False) for i, child in enumerate(el))
+                continue
+            if el.text:
+                el.text, elements = self.wrap_abbrs(el.text)
+                if elements:
+                    el[:0] = elements
+            if parent is not None and el.tail:
+                el.tail, elements = self.wrap_abbrs(el.tail)
+                if elements:
+                    parent[index + 1:index + 1] = elements
 
     def run(self, root: etree.Element) -> etree.Element | None:
         ''' Step through tree to find known abbreviations. '''
         if not self.abbrs:
             # No abbreviations defined. Skip running processor.
             return
-        # Build and compile regex
-        abbr_list = list(self.abbrs.keys())
-        abbr_list.sort(key=len, reverse=True)
-        self.RE = re.compile(f"\\b(?:{ '|'.join(re.escape(key) for key in abbr_list) })\\b")
+        # Build and compile regex. Identical sets of abbreviations share one compiled regex.
+        abbr_set = frozenset(self.abbrs)
+        self.RE = _compile_abbr_re(abbr_set)
+        # Text which contains none of the first characters cannot contain an abbreviation.
+        # An empty abbreviation can match anywhere, so don't filter in that case.
+        self._first_chars = None if '' in abbr_set else frozenset(abbr[0] for abbr in abbr_set)
         # Step through tree and modify on matches
         self.iter_element(root)
 
@@ -145,6 +249,10 @@ class AbbrBlockprocessor(BlockProcessor):
 
         """
         block = blocks.pop(0)
+        if '*[' not in block:
+            # No abbreviation references in this block. Restore block.
+            blocks.insert(0, block)
+            return False
         m = self.RE.search(block)
         if m:
             abbr = m.group('abbr').strip()
@@ -135,7 +135,7 @@ class HTMLExtractorExtra(HTMLExtractor):
             else:
                 text = self.get_starttag_text()
                 if self.mdstate and self.mdstate[-1] == "off":
-                    self.handle_data(self.md.htmlStash.store(text))
+                    self.handle_data(self._stash(text))
                 else:
                     self.handle_data(text)
                 if tag in self.CDATA_CONTENT_ELEMENTS:
@@ -163,19 +163,19 @@ class HTMLExtractorExtra(HTMLExtractor):
                     # If we only have one newline before block element, add another
                     if not item.endswith('\n\n') and item.endswith('\n'):
                         self.cleandoc.append('\n')
-                    self.cleandoc.append(self.md.htmlStash.store(element))
+                    self.cleandoc.append(self._stash(element))
                     self.cleandoc.append('\n\n')
                     self.state = []
                     # Check if element has a tail
                     if not blank_line_re.match(
-                            self.rawdata[self.line_offset + self.offset + len(self.get_endtag_text(tag)):]):
+                            self.rawdata, self.line_offset + self.offset + len(self.get_endtag_text(tag))):
                         # More content exists after `endtag`.
                         self.intail = True
             else:
                 # Treat orphan closing tag as a span level tag.
                 text = self.get_endtag_text(tag)
                 if self.mdstate and self.mdstate[-1] == "off":
-                    self.handle_data(self.md.htmlStash.store(text))
+                    self.handle_data(self._stash(text))
                 else:
                     self.handle_data(text)
         else:
@@ -185,7 +185,7 @@ class HTMLExtractorExtra(HTMLExtractor):
             else:
                 text = self.get_endtag_text(tag)
                 if self.mdstate and self.mdstate[-1] == "off":
-                    self.handle_data(self.md.htmlStash.store(text))
+                    self.handle_data(self._stash(text))
                 else:
                     self.handle_data(text)
 
@@ -200,7 +200,7 @@ class HTMLExtractorExtra(HTMLExtractor):
                 data = self.get_starttag_text()
         else:
             data = self.get_starttag_text()
-        self.handle_empty_tag(data, is_block=self.md.is_block_level(tag))
+        self.handle_empty_tag(data, is_block=self._is_block(tag))
 
     def handle_data(self, data):
         if self.intail and '\n' in data:
@@ -215,9 +215,9 @@ class HTMLExtractorExtra(HTMLExtractor):
             super().handle_empty_tag(data, is_block)
         else:
             if self.at_line_start() and is_block:
-                self.handle_data('\n' + self.md.htmlStash.store(data) + '\n\n')
+                self.handle_data('\n' + self._stash(data) + '\n\n')
             else:
-                self.handle_data(self.md.htmlStash.store(data))
+                self.handle_data(self._stash(data))
 
     def parse_pi(self, i: int) -> int:
         if self.at_line_start() or self.intail or self.mdstack:
@@ -245,6 +245,8 @@ class HtmlBlockPreprocessor(Preprocessor):
 
     def run(self, lines: list[str]) -> list[str]:
         source = '\n'.join(lines)
+        if not HTMLExtractorExtra.needs_parsing(source):
+            return source.split('\n')
         parser = HTMLExtractorExtra(self.md)
         parser.feed(source)
         parser.close()
@@ -54,33 +54,41 @@ class TableProcessor(BlockProcessor):
 
         Keep border check and separator row do avoid repeating the work.
         """
-        is_table = False
-        rows = [row.strip(' ') for row in block.split('\n')]
-        if len(rows) > 1:
-            header0 = rows[0]
-            self.border = PIPE_NONE
-            if header0.startswith('|'):
-                self.border |= PIPE_LEFT
-            if self.RE_END_BORDER.search(header0) is not None:
-                self.border |= PIPE_RIGHT
-            row = self._split_row(header0)
-            row0_len = len(row)
-            is_table = row0_len > 1
-
-            # Each row in a single column table needs at least one pipe.
-            if not is_table and row0_len == 1 and self.border:
-                for index in range(1, len(rows)):
-                    is_table = rows[index].startswith('|')
-                    if not is_table:
-                        is_table = self.RE_END_BORDER.search(rows[index]) is not None
-                    if not is_table:
-                        break
+        # Every table has at least two rows and at least one pipe. Reject
+        # anything else before doing any real work.
+        if '|' not in block:
+            return False
+        nl = block.find('\n')
+        if nl < 0:
+            return False
+
+        end_border_search = self.RE_END_BORDER.search
+        header0 = block[:nl].strip(' ')
+        self.border = PIPE_NONE
+        if header0.startswith('|'):
+            self.border |= PIPE_LEFT
+        if end_border_search(header0) is not None:
+            self.border |= PIPE_RIGHT
+        row = self._split_row(header0)
+        row0_len = len(row)
+        is_table = row0_len > 1
+
+        # Each row in a single column table needs at least one pipe.
+        if not is_table and row0_len == 1 and self.border:
+            for line in block[nl + 1:].split('\n'):
+                line = line.strip(' ')
+                is_table = line.startswith('|')
+                if not is_table:
+                    is_table = end_border_search(line) is not None
+                if not is_table:
+                    break
 
+        if is_table:
+            row1 = block[nl + 1:].split('\n', 1)[0]
+            row = self._split_row(row1.strip(' '))
+            is_table = (len(row) == row0_len) and set(''.join(row)) <= set('|:- ')
             if is_table:
-                row = self._split_row(rows[1])
-                is_table = (len(row) == row0_len) and set(''.join(row)) <= set('|:- ')
-                if is_table:
-                    self.separator = row
+                self.separator = row
 
         return is_table
 
@@ -154,6 +162,10 @@ class TableProcessor(BlockProcessor):
 
     def _split(self, row: str) -> list[str]:
         """ split a row of text with some code into a list of cells. """
+        if '`' not in row and '\\' not in row:
+            # Without code spans or escapes every pipe is a table delimiter.
+            return row.split('|')
+
         elements = []
         pipes = []
         tics = []
@@ -161,6 +173,11 @@ class TableProcessor(BlockProcessor):
         tic_region = []
         good_pipes = []
 
+        # Bind frequently used methods to locals for the loop below.
+        tics_append = tics.append
+        tic_points_append = tic_points.append
+        pipes_append = pipes.append
+
         # Parse row
         # Throw out \\, and \|
         for m in self.RE_CODE_PIPES.finditer(row):
@@ -168,18 +185,18 @@ class TableProcessor(BlockProcessor):
             if m.group(2):
                 # \`+
                 # Store length of each tic group: subtract \
-                tics.append(len(m.group(2)) - 1)
+                tics_append(len(m.group(2)) - 1)
                 # Store start of group, end of group, and escape length
-                tic_points.append((m.start(2), m.end(2) - 1, 1))
+                tic_points_append((m.start(2), m.end(2) - 1, 1))
             elif m.group(3):
                 # `+
                 # Store length of each tic group
-                tics.append(len(m.group(3)))
+                tics_append(len(m.group(3)))
                 # Store start of group, end of group, and escape length
-                tic_points.append((m.start(3), m.end(3) - 1, 0))
+                tic_points_append((m.start(3), m.end(3) - 1, 0))
             # Store pipe location
             elif m.group(5):
-                pipes.append(m.start(5))
+                pipes_append(m.start(5))
 
         # Pair up tics according to size if possible
         # Subtract the escape length *only* from the opening.
@@ -192,29 +209,26 @@ class TableProcessor(BlockProcessor):
                 tic_size = tics[pos] - tic_points[pos][2]
                 if tic_size == 0:
                     raise ValueError
-                index = tics[pos + 1:].index(tic_size) + 1
-                tic_region.append((tic_points[pos][0], tic_points[pos + index][1]))
-                pos += index + 1
+                index = tics.index(tic_size, pos + 1)
+                tic_region.append((tic_points[pos][0], tic_points[index][1]))
+                pos = index + 1
             except ValueError:
                 pos += 1
 
         # Resolve pipes.  Check if they are within a tic pair region.
-        # Walk through pipes comparing them to each region.
-        #     - If pipe position is less that a region, it isn't in a region
-        #     - If it is within a region, we don't want it, so throw it out
-        #     - If we didn't throw it out, it must be a table pipe
+        # Both pipes and regions are sorted by position, so walk through them together.
+        #     - Skip any regions which end before the pipe, they can't contain it or any later pipe
+        #     - If the pipe is within the next region, we don't want it, so throw it out
+        #     - Otherwise, it must be a table pipe
+        region = 0
+        region_len = len(tic_region)
         for pipe in pipes:
-            throw_out = False
-            for region in tic_region:
-                if pipe < region[0]:
-                    # Pipe is not in a region
-                    break
-                elif region[0] <= pipe <= region[1]:
-                    # Pipe is within a code region.  Throw it out.
-                    throw_out = True
-                    break
-            if not throw_out:
-                good_pipes.append(pipe)
+            while region < region_len and tic_region[region][1] < pipe:
+                region += 1
+            if region < region_len and tic_region[region][0] <= pipe:
+                # Pipe is within a code region.  Throw it out.
+                continue
+            good_pipes.append(pipe)
 
         # Split row according to table delimiters.
         pos = 0
@@ -28,10 +28,17 @@ import re
 from typing import Any
 
 
+LABEL_RE = re.compile(r'([ ]+_)|(_[ ]+)|([ ]+)')
+
+
 def build_url(label: str, base: str, end: str) -> str:
     """ Build a URL from the label, a base, and an end. """
-    clean_label = re.sub(r'([ ]+_)|(_[ ]+)|([ ]+)', '_', label)
-    return '{}{}{}'.format(base, clean_label, end)
+    if ' ' in label:
+        clean_label = LABEL_RE.sub('_', label)
+    else:
+        # Nothing to collapse.
+        clean_label = label
+    return f'{base}{clean_label}{end}'
 
 
 class WikiLinkExtension(Extension):
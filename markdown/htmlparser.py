@@ -68,7 +68,9 @@ htmlparser.locatestarttagend_tolerant = re.compile(r"""
 
 # Match a blank line at the start of a block of text (two newlines).
 # The newlines may be preceded by additional whitespace.
-blank_line_re = re.compile(r'^([ ]*\n){2}')
+# The pattern is not anchored with `^` so that `blank_line_re.match(text, pos)`
+# can check from a given position without slicing `text`. Always use `match`.
+blank_line_re = re.compile(r'([ ]*\n){2}')
 
 
 class HTMLExtractor(htmlparser.HTMLParser):
@@ -85,13 +87,28 @@ class HTMLExtractor(htmlparser.HTMLParser):
             kwargs['convert_charrefs'] = False
 
         # Block tags that should contain no content (self closing)
-        self.empty_tags = set(['hr'])
+        self.empty_tags = {'hr'}
 
         self.lineno_start_cache = [0]
 
         # This calls self.reset
         super().__init__(*args, **kwargs)
         self.md = md
+        # Bind methods of `md` which are called for most tags.
+        self._is_block = md.is_block_level
+        self._stash = md.htmlStash.store
+
+    @staticmethod
+    def needs_parsing(text: str) -> bool:
+        """
+        Return `True` if `text` may contain anything for the parser to extract.
+
+        Without a `<` there are no tags, comments or declarations to stash. The parser
+        also rewrites some malformed character references, such as `&#1#` to `&#1;#`,
+        so text containing a `&` must be parsed as well. Any other text passes through
+        unchanged and callers may skip the parser entirely.
+        """
+        return '<' in text or '&' in text
 
     def reset(self):
         """Reset this instance.  Loses all unprocessed data."""
@@ -116,12 +133,15 @@ class HTMLExtractor(htmlparser.HTMLParser):
                 self.handle_data(self.rawdata)
         # Handle any unclosed tags.
         if len(self._cache):
-            self.cleandoc.append(self.md.htmlStash.store(''.join(self._cache)))
+            self.cleandoc.append(self._stash(''.join(self._cache)))
             self._cache = []
 
     @property
     def line_offset(self) -> int:
         """Returns char index in `self.rawdata` for the start of the current line. """
+        if self.lineno <= len(self.lineno_start_cache):
+            # Start of this line has already been found.
+            return self.lineno_start_cache[self.lineno-1]
         for ii in range(len(self.lineno_start_cache)-1, self.lineno-1):
             last_line_start_pos = self.lineno_start_cache[ii]
             lf_pos = self.rawdata.find('\n', last_line_start_pos)
@@ -143,7 +163,9 @@ class HTMLExtractor(htmlparser.HTMLParser):
         if self.offset > 3:
             return False
         # Confirm up to first 3 chars are whitespace
-        return self.rawdata[self.line_offset:self.line_offset + self.offset].strip() == ''
+        line_offset = self.line_offset
+        prefix = self.rawdata[line_offset:line_offset + self.offset]
+        return not prefix or prefix.isspace()
 
     def get_endtag_text(self, tag: str) -> str:
         """
@@ -153,12 +175,14 @@ class HTMLExtractor(htmlparser.HTMLParser):
         """
         # Attempt to extract actual tag from raw source text
         start = self.line_offset + self.offset
-        m = htmlparser.endendtag.search(self.rawdata, start)
-        if m:
-            return self.rawdata[start:m.end()]
+        # The end tag runs to the first `>`. This is what `htmlparser.endendtag` matches,
+        # but a plain string search avoids running the regex engine for every end tag.
+        end = self.rawdata.find('>', start)
+        if end != -1:
+            return self.rawdata[start:end + 1]
         else:  # pragma: no cover
             # Failed to extract from raw data. Assume well formed and lowercase.
-            return '</{}>'.format(tag)
+            return f'</{tag}>'
 
     def handle_starttag(self, tag: str, attrs: Sequence[tuple[str, str]]):
         # Handle tags that should always be empty and do not specify a closing tag
@@ -166,12 +190,12 @@ class HTMLExtractor(htmlparser.HTMLParser):
             self.handle_startendtag(tag, attrs)
             return
 
-        if self.md.is_block_level(tag) and (self.intail or (self.at_line_start() and not self.inraw)):
+        if self._is_block(tag) and (self.intail or (self.at_line_start() and not self.inraw)):
             # Started a new raw block. Prepare stack.
             self.inraw = True
             self.cleandoc.append('\n')
 
-        text = self.get_starttag_text()
+        text = self._starttag_text
         if self.inraw:
             self.stack.append(tag)
             self._cache.append(text)
@@ -187,13 +211,11 @@ class HTMLExtractor(htmlparser.HTMLParser):
         if self.inraw:
             self._cache.append(text)
             if tag in self.stack:
-                # Remove tag from stack
-                while self.stack:
-                    if self.stack.pop() == tag:
-                        break
+                # Remove the last occurrence of tag, and any unclosed tags after it, from stack
+                del self.stack[len(self.stack) - 1 - self.stack[::-1].index(tag):]
             if len(self.stack) == 0:
                 # End of raw block.
-                if blank_line_re.match(self.rawdata[self.line_offset + self.offset + len(text):]):
+                if blank_line_re.match(self.rawdata, self.line_offset + self.offset + len(text)):
                     # Preserve blank line and end of raw block.
                     self._cache.append('\n')
                 else:
@@ -201,7 +223,7 @@ class HTMLExtractor(htmlparser.HTMLParser):
                     self.intail = True
                 # Reset stack.
                 self.inraw = False
-                self.cleandoc.append(self.md.htmlStash.store(''.join(self._cache)))
+                self.cleandoc.append(self._stash(''.join(self._cache)))
                 # Insert blank line between this and next line.
                 self.cleandoc.append('\n\n')
                 self._cache = []
@@ -223,7 +245,7 @@ class HTMLExtractor(htmlparser.HTMLParser):
             self._cache.append(data)
         elif self.at_line_start() and is_block:
             # Handle this as a standalone raw block
-            if blank_line_re.match(self.rawdata[self.line_offset + self.offset + len(data):]):
+            if blank_line_re.match(self.rawdata, self.line_offset + self.offset + len(data)):
                 # Preserve blank line after tag in raw block.
                 data += '\n'
             else:
@@ -233,33 +255,33 @@ class HTMLExtractor(htmlparser.HTMLParser):
             # If we only have one newline before block element, add another
             if not item.endswith('\n\n') and item.endswith('\n'):
                 self.cleandoc.append('\n')
-            self.cleandoc.append(self.md.htmlStash.store(data))
+            self.cleandoc.append(self._stash(data))
             # Insert blank line between this and next line.
             self.cleandoc.append('\n\n')
         else:
             self.cleandoc.append(data)
 
     def handle_startendtag(self, tag: str, attrs):
-        self.handle_empty_tag(self.get_starttag_text(), is_block=self.md.is_block_level(tag))
+        self.handle_empty_tag(self._starttag_text, is_block=self._is_block(tag))
 
     def handle_charref(self, name: str):
-        self.handle_empty_tag('&#{};'.format(name), is_block=False)
+        self.handle_empty_tag(f'&#{name};', is_block=False)
 
     def handle_entityref(self, name: str):
-        self.handle_empty_tag('&{};'.format(name), is_block=False)
+        self.handle_empty_tag(f'&{name};', is_block=False)
 
     def handle_comment(self, data: str):
-        self.handle_empty_tag('<!--{}-->'.format(data), is_block=True)
+        self.handle_empty_tag(f'<!--{data}-->', is_block=True)
 
     def handle_decl(self, data: str):
-        self.handle_empty_tag('<!{}>'.format(data), is_block=True)
+        self.handle_empty_tag(f'<!{data}>', is_block=True)
 
     def handle_pi(self, data: str):
-        self.handle_empty_tag('<?{}?>'.format(data), is_block=True)
+        self.handle_empty_tag(f'<?{data}?>', is_block=True)
 
     def unknown_decl(self, data: str):
         end = ']]>' if data.startswith('CDATA[') else ']>'
-        self.handle_empty_tag('<![{}{}'.format(data, end), is_block=True)
+        self.handle_empty_tag(f'<![{data}{end}', is_block=True)
 
     def parse_pi(self, i: int) -> int:
         if self.at_line_start() or self.intail:
@@ -287,22 +309,23 @@ class HTMLExtractor(htmlparser.HTMLParser):
         return pos
 
     # The rest has been copied from base class in standard lib to address #1036.
-    # As `__startag_text` is private, all references to it must be in this subclass.
+    # As the base class stores the start tag text in its own private `__starttag_text`, this subclass
+    # keeps it in `_starttag_text` and overrides `get_starttag_text` to return it.
     # The last few lines of `parse_starttag` are reversed so that `handle_starttag`
     # can override `cdata_mode` in certain situations (in a code span).
-    __starttag_text: str | None = None
+    _starttag_text: str | None = None
 
     def get_starttag_text(self) -> str:
         """Return full source of start tag: `<...>`."""
-        return self.__starttag_text
+        return self._starttag_text
 
     def parse_starttag(self, i: int) -> int:  # pragma: no cover
-        self.__starttag_text = None
+        self._starttag_text = None
         endpos = self.check_for_whole_start_tag(i)
         if endpos < 0:
             return endpos
         rawdata = self.rawdata
-        self.__starttag_text = rawdata[i:endpos]
+        self._starttag_text = rawdata[i:endpos]
 
         # Now parse the data between `i+1` and `j` into a tag and `attrs`
         attrs = []
@@ -310,8 +333,9 @@ class HTMLExtractor(htmlparser.HTMLParser):
         assert match, 'unexpected call to parse_starttag()'
         k = match.end()
         self.lasttag = tag = match.group(1).lower()
+        attrfind_match = htmlparser.attrfind_tolerant.match
         while k < endpos:
-            m = htmlparser.attrfind_tolerant.match(rawdata, k)
+            m = attrfind_match(rawdata, k)
             if not m:
                 break
             attrname, rest, attrvalue = m.group(1, 2, 3)
@@ -328,12 +352,12 @@ class HTMLExtractor(htmlparser.HTMLParser):
         end = rawdata[k:endpos].strip()
         if end not in (">", "/>"):
             lineno, offset = self.getpos()
-            if "\n" in self.__starttag_text:
-                lineno = lineno + self.__starttag_text.count("\n")
-                offset = len(self.__starttag_text) \
-                         - self.__starttag_text.rfind("\n")  # noqa: E127
+            if "\n" in self._starttag_text:
+                lineno = lineno + self._starttag_text.count("\n")
+                offset = len(self._starttag_text) \
+                         - self._starttag_text.rfind("\n")  # noqa: E127
             else:
-                offset = offset + len(self.__starttag_text)
+                offset = offset + len(self._starttag_text)
             self.handle_data(rawdata[i:endpos])
             return endpos
         if end.endswith('/>'):
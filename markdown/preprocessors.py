@@ -85,6 +85,8 @@ class HtmlBlockPreprocessor(Preprocessor):
 
     def run(self, lines: list[str]) -> list[str]:
         source = '\n'.join(lines)
+        if not HTMLExtractor.needs_parsing(source):
+            return source.split('\n')
         parser = HTMLExtractor(self.md)
         parser.feed(source)
         parser.close()
@@ -12,6 +12,16 @@ per_module_options = {
     "markdown": {"summary": {"attributes": True, "functions": True, "classes": True}}
 }
 
+
+def format_options(options):
+    """Return `options` as an indented YAML block for a `:::` directive."""
+    return textwrap.indent(yaml.dump({"options": options}), prefix='    ')
+
+
+# The options never change, so only serialize them once.
+module_options = {ident: format_options(options) for ident, options in per_module_options.items()}
+extension_options = format_options({"inherited_members": False})
+
 base_path = Path(__file__).resolve().parent.parent
 
 modules = [
@@ -26,7 +36,7 @@ modules = [
     base_path.joinpath("markdown", "util.py"),
     base_path.joinpath("markdown", "htmlparser.py"),
     base_path.joinpath("markdown", "test_tools.py"),
-    *sorted(base_path.joinpath("markdown", "extensions").rglob("*.py")),
+    *sorted(base_path.joinpath("markdown", "extensions").glob("*.py")),
 ]
 
 for src_path in modules:
@@ -50,12 +60,10 @@ for src_path in modules:
     with mkdocs_gen_files.open(full_doc_path, "w") as fd:
         ident = ".".join(parts)
         fd.write(f"::: {ident}")
-        if ident in per_module_options:
-            yaml_options = yaml.dump({"options": per_module_options[ident]})
-            fd.write(f"\n{textwrap.indent(yaml_options, prefix='    ')}")
+        if ident in module_options:
+            fd.write(f"\n{module_options[ident]}")
         elif ident.startswith("markdown.extensions."):
-            yaml_options = yaml.dump({"options": {"inherited_members": False}})
-            fd.write(f"\n{textwrap.indent(yaml_options, prefix='    ')}")
+            fd.write(f"\n{extension_options}")
 
     mkdocs_gen_files.set_edit_path(full_doc_path, ".." / path)
 
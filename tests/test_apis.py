@@ -25,16 +25,17 @@ Tests of the various APIs with the Python Markdown library.
 """
 
 import unittest
+from unittest import mock
 import sys
 import os
 import markdown
 import warnings
-from markdown.__main__ import parse_options
+from functools import lru_cache
 from markdown import inlinepatterns
 from logging import DEBUG, WARNING, CRITICAL
-import yaml
 import tempfile
 from io import BytesIO, StringIO, TextIOWrapper
+from types import MappingProxyType
 import xml.etree.ElementTree as etree
 from xml.etree.ElementTree import ProcessingInstruction
 
@@ -42,9 +43,14 @@ from xml.etree.ElementTree import ProcessingInstruction
 class TestMarkdownBasics(unittest.TestCase):
     """ Tests basics of the Markdown class. """
 
+    @classmethod
+    def setUpClass(cls):
+        """ Create a shared instance of Markdown. """
+        cls.md = markdown.Markdown()
+
     def setUp(self):
-        """ Create instance of Markdown. """
-        self.md = markdown.Markdown()
+        """ Reset the shared instance of Markdown. """
+        self.md.reset()
 
     def testBlankInput(self):
         """ Test blank input. """
@@ -79,6 +85,19 @@ class TestMarkdownBasics(unittest.TestCase):
 class TestConvertFile(unittest.TestCase):
     """ Tests of ConvertFile. """
 
+    @classmethod
+    def setUpClass(cls):
+        infd, cls.infile = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(infd, 'w') as fp:
+            fp.write('foo')
+        outfd, cls.outfile = tempfile.mkstemp(suffix='.html')
+        os.close(outfd)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.infile)
+        os.remove(cls.outfile)
+
     def setUp(self):
         self.saved = sys.stdin, sys.stdout
         sys.stdin = StringIO('foo')
@@ -87,18 +106,9 @@ class TestConvertFile(unittest.TestCase):
     def tearDown(self):
         sys.stdin, sys.stdout = self.saved
 
-    def getTempFiles(self, src):
-        """ Return the file names for two temp files. """
-        infd, infile = tempfile.mkstemp(suffix='.txt')
-        with os.fdopen(infd, 'w') as fp:
-            fp.write(src)
-        outfd, outfile = tempfile.mkstemp(suffix='.html')
-        return infile, outfile, outfd
-
     def testFileNames(self):
-        infile, outfile, outfd = self.getTempFiles('foo')
-        markdown.markdownFromFile(input=infile, output=outfile)
-        with os.fdopen(outfd, 'r') as fp:
+        markdown.markdownFromFile(input=self.infile, output=self.outfile)
+        with open(self.outfile, 'r') as fp:
             output = fp.read()
         self.assertEqual(output, '<p>foo</p>')
 
@@ -118,9 +128,10 @@ class TestConvertFile(unittest.TestCase):
 class TestBlockParser(unittest.TestCase):
     """ Tests of the BlockParser class. """
 
-    def setUp(self):
-        """ Create instance of BlockParser. """
-        self.parser = markdown.Markdown().parser
+    @classmethod
+    def setUpClass(cls):
+        """ Create a shared instance of BlockParser. """
+        cls.parser = markdown.Markdown().parser
 
     def testParseChunk(self):
         """ Test `BlockParser.parseChunk`. """
@@ -185,20 +196,24 @@ class TestBlockParserState(unittest.TestCase):
 class TestHtmlStash(unittest.TestCase):
     """ Test Markdown's `HtmlStash`. """
 
+    # Expected placeholders for the first two stored blocks.
+    PLACEHOLDER0 = markdown.util.HtmlStash().get_placeholder(0)
+    PLACEHOLDER1 = markdown.util.HtmlStash().get_placeholder(1)
+
     def setUp(self):
         self.stash = markdown.util.HtmlStash()
         self.placeholder = self.stash.store('foo')
 
     def testSimpleStore(self):
         """ Test `HtmlStash.store`. """
-        self.assertEqual(self.placeholder, self.stash.get_placeholder(0))
+        self.assertEqual(self.placeholder, self.PLACEHOLDER0)
         self.assertEqual(self.stash.html_counter, 1)
         self.assertEqual(self.stash.rawHtmlBlocks, ['foo'])
 
     def testStoreMore(self):
         """ Test `HtmlStash.store` with additional blocks. """
         placeholder = self.stash.store('bar')
-        self.assertEqual(placeholder, self.stash.get_placeholder(1))
+        self.assertEqual(placeholder, self.PLACEHOLDER1)
         self.assertEqual(self.stash.html_counter, 2)
         self.assertEqual(
             self.stash.rawHtmlBlocks,
@@ -227,6 +242,21 @@ class Item:
 class RegistryTests(unittest.TestCase):
     """ Test the processor registry. """
 
+    @classmethod
+    def setUpClass(cls):
+        # A registry shared by the tests which only read from it.
+        cls.ab_registry = cls.build_registry(('b', 'b', 30))
+        cls.item_a = Item('a')
+        cls.ab_registry.register(cls.item_a, 'a', 20)
+
+    @staticmethod
+    def build_registry(*items):
+        """ Return a new `Registry` holding an `Item` for each `(data, name, priority)` tuple. """
+        r = markdown.util.Registry()
+        for data, name, priority in items:
+            r.register(Item(data), name, priority)
+        return r
+
     def testCreateRegistry(self):
         r = markdown.util.Registry()
         r.register(Item('a'), 'a', 20)
@@ -254,14 +284,17 @@ class RegistryTests(unittest.TestCase):
         self.assertIs(r._is_sorted, True)
         r.register(Item('b'), 'b', 21)
         self.assertIs(r._is_sorted, False)
-        r['a']
-        self.assertIs(r._is_sorted, True)
-        r._is_sorted = False
-        r.get_index_for_name('a')
-        self.assertIs(r._is_sorted, True)
-        r._is_sorted = False
-        repr(r)
-        self.assertIs(r._is_sorted, True)
+        # Each of these must sort an unsorted registry.
+        probes = (
+            ('__getitem__', lambda: r['a']),
+            ('get_index_for_name', lambda: r.get_index_for_name('a')),
+            ('__repr__', lambda: repr(r)),
+        )
+        for name, probe in probes:
+            with self.subTest(probe=name):
+                r._is_sorted = False
+                probe()
+                self.assertIs(r._is_sorted, True)
 
     def testDeregister(self):
         r = markdown.util.Registry()
@@ -282,32 +315,24 @@ class RegistryTests(unittest.TestCase):
         self.assertEqual(list(r), ['a'])
 
     def testRegistryContains(self):
-        r = markdown.util.Registry()
-        item = Item('a')
-        r.register(item, 'a', 20)
+        r = self.ab_registry
         self.assertIs('a' in r, True)
-        self.assertIn(item, r)
-        self.assertNotIn('b', r)
+        self.assertIn(self.item_a, r)
+        self.assertNotIn('c', r)
 
     def testRegistryIter(self):
-        r = markdown.util.Registry()
-        r.register(Item('a'), 'a', 20)
-        r.register(Item('b'), 'b', 30)
+        r = self.ab_registry
         self.assertEqual(list(r), ['b', 'a'])
 
     def testRegistryGetItemByIndex(self):
-        r = markdown.util.Registry()
-        r.register(Item('a'), 'a', 20)
-        r.register(Item('b'), 'b', 30)
+        r = self.ab_registry
         self.assertEqual(r[0], 'b')
         self.assertEqual(r[1], 'a')
         with self.assertRaises(IndexError):
             r[3]
 
     def testRegistryGetItemByItem(self):
-        r = markdown.util.Registry()
-        r.register(Item('a'), 'a', 20)
-        r.register(Item('b'), 'b', 30)
+        r = self.ab_registry
         self.assertEqual(r['a'], 'a')
         self.assertEqual(r['b'], 'b')
         with self.assertRaises(KeyError):
@@ -329,19 +354,14 @@ class RegistryTests(unittest.TestCase):
             del r['a']
 
     def testRegistrySlice(self):
-        r = markdown.util.Registry()
-        r.register(Item('a'), 'a', 20)
-        r.register(Item('b'), 'b', 30)
-        r.register(Item('c'), 'c', 40)
+        r = self.build_registry(('a', 'a', 20), ('b', 'b', 30), ('c', 'c', 40))
         slc = r[1:]
         self.assertEqual(len(slc), 2)
         self.assertIsInstance(slc, markdown.util.Registry)
         self.assertEqual(list(slc), ['b', 'a'])
 
     def testGetIndexForName(self):
-        r = markdown.util.Registry()
-        r.register(Item('a'), 'a', 20)
-        r.register(Item('b'), 'b', 30)
+        r = self.ab_registry
         self.assertEqual(r.get_index_for_name('a'), 1)
         self.assertEqual(r.get_index_for_name('b'), 0)
         with self.assertRaises(ValueError):
@@ -361,47 +381,51 @@ class RegistryTests(unittest.TestCase):
 class TestErrors(unittest.TestCase):
     """ Test Error Reporting. """
 
-    def setUp(self):
-        # Set warnings to be raised as errors
+    @classmethod
+    def setUpClass(cls):
+        # Set warnings to be raised as errors for the whole class
+        cls._warnings = warnings.catch_warnings()
+        cls._warnings.__enter__()
         warnings.simplefilter('error')
 
-    def tearDown(self):
-        # Reset warning behavior back to default
-        warnings.simplefilter('default')
+    @classmethod
+    def tearDownClass(cls):
+        # Restore the warning filters in place before the class ran
+        cls._warnings.__exit__(None, None, None)
+
+    def assertMarkdownRaises(self, exc, **kwargs):
+        """ Assert that creating a `Markdown` instance with `kwargs` raises `exc`. """
+        self.assertRaises(exc, markdown.Markdown, **kwargs)
 
     def testBadOutputFormat(self):
         """ Test failure on bad output_format. """
-        self.assertRaises(KeyError, markdown.Markdown, output_format='invalid')
+        self.assertMarkdownRaises(KeyError, output_format='invalid')
 
     def testLoadExtensionFailure(self):
         """ Test failure of an extension to load. """
-        self.assertRaises(
-            ImportError,
-            markdown.Markdown, extensions=['non_existant_ext']
-        )
+        self.assertMarkdownRaises(ImportError, extensions=['non_existant_ext'])
 
     def testLoadBadExtension(self):
         """ Test loading of an Extension with no makeExtension function. """
-        self.assertRaises(AttributeError, markdown.Markdown, extensions=['markdown.util'])
+        self.assertMarkdownRaises(AttributeError, extensions=['markdown.util'])
 
     def testNonExtension(self):
         """ Test loading a non Extension object as an extension. """
-        self.assertRaises(TypeError, markdown.Markdown, extensions=[object])
+        self.assertMarkdownRaises(TypeError, extensions=[object])
 
     def testDotNotationExtensionWithBadClass(self):
         """ Test Extension loading with non-existent class name (`path.to.module:Class`). """
-        self.assertRaises(
-            AttributeError,
-            markdown.Markdown,
-            extensions=['markdown.extensions.footnotes:MissingExtension']
-        )
+        self.assertMarkdownRaises(AttributeError, extensions=['markdown.extensions.footnotes:MissingExtension'])
 
     def testBaseExtention(self):
         """ Test that the base Extension class will raise `NotImplemented`. """
-        self.assertRaises(
-            NotImplementedError,
-            markdown.Markdown, extensions=[markdown.extensions.Extension()]
-        )
+        self.assertMarkdownRaises(NotImplementedError, extensions=[markdown.extensions.Extension()])
+
+
+@lru_cache(maxsize=None)
+def _pretty():
+    """ Return a `PrettifyTreeprocessor` shared by the tests, which keeps no state between runs. """
+    return markdown.treeprocessors.PrettifyTreeprocessor(markdown.Markdown())
 
 
 class testETreeComments(unittest.TestCase):
@@ -437,8 +461,7 @@ class testETreeComments(unittest.TestCase):
 
     def testCommentPrettify(self):
         """ Test that an `ElementTree` `Comment` is prettified properly. """
-        pretty = markdown.treeprocessors.PrettifyTreeprocessor(markdown.Markdown())
-        pretty.run(self.comment)
+        _pretty().run(self.comment)
         self.assertEqual(
             markdown.serializers.to_html_string(self.comment),
             '<!--foo-->\n'
@@ -448,7 +471,7 @@ class testETreeComments(unittest.TestCase):
 class testElementTailTests(unittest.TestCase):
     """ Element Tail Tests """
     def setUp(self):
-        self.pretty = markdown.treeprocessors.PrettifyTreeprocessor(markdown.Markdown())
+        self.pretty = _pretty()
 
     def testBrTailNoNewline(self):
         """ Test that last `<br>` in tree has a new line tail """
@@ -462,8 +485,7 @@ class testElementTailTests(unittest.TestCase):
 class testElementPreCodeTests(unittest.TestCase):
     """ Element `PreCode` Tests """
     def setUp(self):
-        md = markdown.Markdown()
-        self.pretty = markdown.treeprocessors.PrettifyTreeprocessor(md)
+        self.pretty = _pretty()
 
     def prettify(self, xml):
         root = etree.fromstring(xml)
@@ -499,12 +521,19 @@ class testElementPreCodeTests(unittest.TestCase):
 class testSerializers(unittest.TestCase):
     """ Test the html and xhtml serializers. """
 
-    def testHtml(self):
-        """ Test HTML serialization. """
+    @classmethod
+    def setUpClass(cls):
+        # The serializers only read the tree, so each fixture is built once.
+        cls.html_el = cls.build_tree('foo <&escaped>')
+        cls.xhtml_el = cls.build_tree('foo<&escaped>')
+
+    @staticmethod
+    def build_tree(text):
+        """ Return the serializer test tree with `text` as the paragraph text. """
         el = etree.Element('div')
         el.set('id', 'foo<&">')
         p = etree.SubElement(el, 'p')
-        p.text = 'foo <&escaped>'
+        p.text = text
         p.set('hidden', 'hidden')
         etree.SubElement(el, 'hr')
         non_element = etree.SubElement(el, None)
@@ -512,8 +541,12 @@ class testSerializers(unittest.TestCase):
         script = etree.SubElement(non_element, 'script')
         script.text = '<&"test\nescaping">'
         el.tail = "tail text"
+        return el
+
+    def testHtml(self):
+        """ Test HTML serialization. """
         self.assertEqual(
-            markdown.serializers.to_html_string(el),
+            markdown.serializers.to_html_string(self.html_el),
             '<div id="foo&lt;&amp;&quot;&gt;">'
             '<p hidden>foo &lt;&amp;escaped&gt;</p>'
             '<hr>'
@@ -524,19 +557,8 @@ class testSerializers(unittest.TestCase):
 
     def testXhtml(self):
         """" Test XHTML serialization. """
-        el = etree.Element('div')
-        el.set('id', 'foo<&">')
-        p = etree.SubElement(el, 'p')
-        p.text = 'foo<&escaped>'
-        p.set('hidden', 'hidden')
-        etree.SubElement(el, 'hr')
-        non_element = etree.SubElement(el, None)
-        non_element.text = 'non-element text'
-        script = etree.SubElement(non_element, 'script')
-        script.text = '<&"test\nescaping">'
-        el.tail = "tail text"
         self.assertEqual(
-            markdown.serializers.to_xhtml_string(el),
+            markdown.serializers.to_xhtml_string(self.xhtml_el),
             '<div id="foo&lt;&amp;&quot;&gt;">'
             '<p hidden="hidden">foo&lt;&amp;escaped&gt;</p>'
             '<hr />'
@@ -664,9 +686,10 @@ class testSerializers(unittest.TestCase):
 class testAtomicString(unittest.TestCase):
     """ Test that `AtomicStrings` are honored (not parsed). """
 
-    def setUp(self):
-        self.md = markdown.Markdown()
-        self.inlineprocessor = self.md.treeprocessors['inline']
+    @classmethod
+    def setUpClass(cls):
+        cls.md = markdown.Markdown()
+        cls.inlineprocessor = cls.md.treeprocessors['inline']
 
     def testString(self):
         """ Test that a regular string is parsed. """
@@ -695,15 +718,12 @@ class testAtomicString(unittest.TestCase):
         tree = etree.Element('div')
         p = etree.SubElement(tree, 'p')
         p.text = markdown.util.AtomicString('*some* ')
-        span1 = etree.SubElement(p, 'span')
-        span1.text = markdown.util.AtomicString('*more* ')
-        span2 = etree.SubElement(span1, 'span')
-        span2.text = markdown.util.AtomicString('*text* ')
-        span3 = etree.SubElement(span2, 'span')
-        span3.text = markdown.util.AtomicString('*here*')
-        span3.tail = markdown.util.AtomicString(' *to*')
-        span2.tail = markdown.util.AtomicString(' *test*')
-        span1.tail = markdown.util.AtomicString(' *with*')
+        parent = p
+        for text, tail in (('*more* ', ' *with*'), ('*text* ', ' *test*'), ('*here*', ' *to*')):
+            span = etree.SubElement(parent, 'span')
+            span.text = markdown.util.AtomicString(text)
+            span.tail = markdown.util.AtomicString(tail)
+            parent = span
         new = self.inlineprocessor.run(tree)
         self.assertEqual(
             markdown.serializers.to_html_string(new),
@@ -719,6 +739,7 @@ class testAtomicString(unittest.TestCase):
         self.md.inlinePatterns.register(
             _InlineProcessorThatReturnsAtomicString(r'marker', self.md), 'test', 100
         )
+        self.addCleanup(self.md.inlinePatterns.deregister, 'test')
         new = self.inlineprocessor.run(tree)
         self.assertEqual(
             markdown.serializers.to_html_string(new),
@@ -733,16 +754,19 @@ class _InlineProcessorThatReturnsAtomicString(inlinepatterns.InlineProcessor):
 
 
 class TestConfigParsing(unittest.TestCase):
-    def assertParses(self, value, result):
-        self.assertIs(markdown.util.parseBoolValue(value, False), result)
+    BOOLEAN_CASES = (
+        (True, True),
+        ('novalue', None),
+        ('yES', True),
+        ('FALSE', False),
+        (0., False),
+        ('none', False),
+    )
 
     def testBooleansParsing(self):
-        self.assertParses(True, True)
-        self.assertParses('novalue', None)
-        self.assertParses('yES', True)
-        self.assertParses('FALSE', False)
-        self.assertParses(0., False)
-        self.assertParses('none', False)
+        for value, result in self.BOOLEAN_CASES:
+            with self.subTest(value=value):
+                self.assertIs(markdown.util.parseBoolValue(value, False), result)
 
     def testPreserveNone(self):
         self.assertIsNone(markdown.util.parseBoolValue('None', preserve_none=True))
@@ -755,123 +779,102 @@ class TestConfigParsing(unittest.TestCase):
 class TestCliOptionParsing(unittest.TestCase):
     """ Test parsing of Command Line Interface Options. """
 
-    def setUp(self):
-        self.default_options = {
-            'input': None,
-            'output': None,
-            'encoding': None,
-            'output_format': 'xhtml',
-            'lazy_ol': True,
-            'extensions': [],
-            'extension_configs': {},
-        }
-        self.tempfile = ''
+    _DEFAULT_OPTIONS = MappingProxyType({
+        'input': None,
+        'output': None,
+        'encoding': None,
+        'output_format': 'xhtml',
+        'lazy_ol': True,
+    })
+
+    @classmethod
+    def setUpClass(cls):
+        # Only these tests need the CLI module, so import it here rather than at collection.
+        from markdown.__main__ import parse_options
+        cls.parse_options = staticmethod(parse_options)
+        # One config file is shared by the class and rewritten by each test which needs it.
+        fd, cls.tempfile = tempfile.mkstemp('.yml')
+        os.close(fd)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.tempfile)
 
-    def tearDown(self):
-        if os.path.isfile(self.tempfile):
-            os.remove(self.tempfile)
+    def setUp(self):
+        self.default_options = dict(self._DEFAULT_OPTIONS)
+        self.default_options['extensions'] = []
+        self.default_options['extension_configs'] = {}
 
     def testNoOptions(self):
-        options, logging_level = parse_options([])
+        options, logging_level = self.parse_options([])
         self.assertEqual(options, self.default_options)
         self.assertEqual(logging_level, CRITICAL)
 
     def testQuietOption(self):
-        options, logging_level = parse_options(['-q'])
+        options, logging_level = self.parse_options(['-q'])
         self.assertGreater(logging_level, CRITICAL)
 
     def testVerboseOption(self):
-        options, logging_level = parse_options(['-v'])
+        options, logging_level = self.parse_options(['-v'])
         self.assertEqual(logging_level, WARNING)
 
     def testNoisyOption(self):
-        options, logging_level = parse_options(['--noisy'])
+        options, logging_level = self.parse_options(['--noisy'])
         self.assertEqual(logging_level, DEBUG)
 
-    def testInputFileOption(self):
-        options, logging_level = parse_options(['foo.txt'])
-        self.default_options['input'] = 'foo.txt'
-        self.assertEqual(options, self.default_options)
-
-    def testOutputFileOption(self):
-        options, logging_level = parse_options(['-f', 'foo.html'])
-        self.default_options['output'] = 'foo.html'
-        self.assertEqual(options, self.default_options)
-
-    def testInputAndOutputFileOptions(self):
-        options, logging_level = parse_options(['-f', 'foo.html', 'foo.txt'])
-        self.default_options['output'] = 'foo.html'
-        self.default_options['input'] = 'foo.txt'
-        self.assertEqual(options, self.default_options)
-
-    def testEncodingOption(self):
-        options, logging_level = parse_options(['-e', 'utf-8'])
-        self.default_options['encoding'] = 'utf-8'
-        self.assertEqual(options, self.default_options)
-
-    def testOutputFormatOption(self):
-        options, logging_level = parse_options(['-o', 'html'])
-        self.default_options['output_format'] = 'html'
-        self.assertEqual(options, self.default_options)
-
-    def testNoLazyOlOption(self):
-        options, logging_level = parse_options(['-n'])
-        self.default_options['lazy_ol'] = False
-        self.assertEqual(options, self.default_options)
-
-    def testExtensionOption(self):
-        options, logging_level = parse_options(['-x', 'markdown.extensions.footnotes'])
-        self.default_options['extensions'] = ['markdown.extensions.footnotes']
-        self.assertEqual(options, self.default_options)
-
-    def testMultipleExtensionOptions(self):
-        options, logging_level = parse_options([
-            '-x', 'markdown.extensions.footnotes',
-            '-x', 'markdown.extensions.smarty'
-        ])
-        self.default_options['extensions'] = [
-            'markdown.extensions.footnotes',
-            'markdown.extensions.smarty'
+    def testOptions(self):
+        cases = [
+            (['foo.txt'], {'input': 'foo.txt'}),
+            (['-f', 'foo.html'], {'output': 'foo.html'}),
+            (['-f', 'foo.html', 'foo.txt'], {'output': 'foo.html', 'input': 'foo.txt'}),
+            (['-e', 'utf-8'], {'encoding': 'utf-8'}),
+            (['-o', 'html'], {'output_format': 'html'}),
+            (['-n'], {'lazy_ol': False}),
+            (['-x', 'markdown.extensions.footnotes'], {'extensions': ['markdown.extensions.footnotes']}),
+            (
+                ['-x', 'markdown.extensions.footnotes', '-x', 'markdown.extensions.smarty'],
+                {'extensions': ['markdown.extensions.footnotes', 'markdown.extensions.smarty']}
+            ),
         ]
-        self.assertEqual(options, self.default_options)
+        for argv, changes in cases:
+            with self.subTest(argv=argv):
+                options, logging_level = self.parse_options(argv)
+                self.assertEqual(options, dict(self.default_options, **changes))
 
     def create_config_file(self, config):
-        """ Helper to create temporary configuration files. """
+        """ Helper to write `config` to the shared configuration file. """
         if not isinstance(config, str):
             # convert to string
+            import yaml
             config = yaml.dump(config)
-        fd, self.tempfile = tempfile.mkstemp('.yml')
-        with os.fdopen(fd, 'w') as fp:
+        with open(self.tempfile, 'w') as fp:
             fp.write(config)
 
     def testExtensionConfigOption(self):
-        config = {
-            'markdown.extensions.wikilinks': {
-                'base_url': 'http://example.com/',
-                'end_url': '.html',
-                'html_class': 'test',
+        configs = {
+            'nested': {
+                'markdown.extensions.wikilinks': {
+                    'base_url': 'http://example.com/',
+                    'end_url': '.html',
+                    'html_class': 'test',
+                },
+                'markdown.extensions.footnotes:FootnotesExtension': {
+                    'PLACE_MARKER': '~~~footnotes~~~'
+                }
+            },
+            'booleans': {
+                'markdown.extensions.toc': {
+                    'title': 'Some Title',
+                    'anchorlink': True,
+                    'permalink': True
+                }
             },
-            'markdown.extensions.footnotes:FootnotesExtension': {
-                'PLACE_MARKER': '~~~footnotes~~~'
-            }
-        }
-        self.create_config_file(config)
-        options, logging_level = parse_options(['-c', self.tempfile])
-        self.default_options['extension_configs'] = config
-        self.assertEqual(options, self.default_options)
-
-    def textBoolExtensionConfigOption(self):
-        config = {
-            'markdown.extensions.toc': {
-                'title': 'Some Title',
-                'anchorlink': True,
-                'permalink': True
-            }
         }
-        self.create_config_file(config)
-        options, logging_level = parse_options(['-c', self.tempfile])
-        self.default_options['extension_configs'] = config
-        self.assertEqual(options, self.default_options)
+        for name, config in configs.items():
+            with self.subTest(config=name):
+                self.create_config_file(config)
+                options, logging_level = self.parse_options(['-c', self.tempfile])
+                self.assertEqual(options, dict(self.default_options, extension_configs=config))
 
     def testExtensionConfigOptionAsJSON(self):
         config = {
@@ -885,21 +888,29 @@ class TestCliOptionParsing(unittest.TestCase):
             }
         }
         import json
-        self.create_config_file(json.dumps(config))
-        options, logging_level = parse_options(['-c', self.tempfile])
-        self.default_options['extension_configs'] = config
-        self.assertEqual(options, self.default_options)
+        from markdown.__main__ import _load_config
+        self.assertEqual(_load_config(StringIO(json.dumps(config))), config)
+
+    def testExtensionConfigOptionUsesLibyaml(self):
+        import yaml
+        if not yaml.__with_libyaml__:
+            self.skipTest('PyYAML was built without libyaml')
+        self.create_config_file({'markdown.extensions.toc': {'title': 'Some Title'}})
+        with mock.patch('yaml.load', wraps=yaml.load) as load:
+            self.parse_options(['-c', self.tempfile])
+        self.assertIs(load.call_args[1]['Loader'], yaml.CUnsafeLoader)
 
     def testExtensionConfigOptionMissingFile(self):
-        self.assertRaises(IOError, parse_options, ['-c', 'missing_file.yaml'])
+        self.assertRaises(IOError, self.parse_options, ['-c', 'missing_file.yaml'])
 
     def testExtensionConfigOptionBadFormat(self):
         config = """
 [footnotes]
 PLACE_MARKER= ~~~footnotes~~~
 """
+        import yaml
         self.create_config_file(config)
-        self.assertRaises(yaml.YAMLError, parse_options, ['-c', self.tempfile])
+        self.assertRaises(yaml.YAMLError, self.parse_options, ['-c', self.tempfile])
 
 
 class TestEscapeAppend(unittest.TestCase):
@@ -953,9 +964,10 @@ class TestAncestorExclusion(unittest.TestCase):
             pattern = r'(\+)([^\+]+)\1'
             md.inlinePatterns.register(TestAncestorExclusion.AncestorExample(pattern, 'strong'), 'ancestor-test', 0)
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Setup markdown object."""
-        self.md = markdown.Markdown(extensions=[TestAncestorExclusion.AncestorExtension()])
+        cls.md = markdown.Markdown(extensions=[TestAncestorExclusion.AncestorExtension()])
 
     def test_ancestors(self):
         """ Test that an extension can exclude parent tags. """
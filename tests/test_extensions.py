@@ -182,6 +182,17 @@ class TestWikiLinks(unittest.TestCase):
             '<p>foo  bar</p>'
         )
 
+    def testWikilinkCollapseWhitespace(self):
+        """ Test runs of spaces and underscores are collapsed in `wikilinks` URLs. """
+        self.assertEqual(
+            self.md.convert('[[foo  bar _baz qux]]'),
+            '<p><a class="wikilink" href="/foo_bar_baz_qux/">foo  bar _baz qux</a></p>'
+        )
+        self.assertEqual(
+            markdown.extensions.wikilinks.build_url('foo__bar', '/', '/'),
+            '/foo__bar/'
+        )
+
     def testSimpleSettings(self):
         """ Test Simple Settings. """
 
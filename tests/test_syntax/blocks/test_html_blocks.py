@@ -26,17 +26,56 @@ import markdown
 
 class TestHTMLBlocks(TestCase):
 
-    def test_raw_paragraph(self):
-        self.assertMarkdownRenders(
-            '<p>A raw paragraph.</p>',
-            '<p>A raw paragraph.</p>'
-        )
-
-    def test_raw_skip_inline_markdown(self):
-        self.assertMarkdownRenders(
-            '<p>A *raw* paragraph.</p>',
-            '<p>A *raw* paragraph.</p>'
-        )
+    @classmethod
+    def setUpClass(cls):
+        # Most tests render with `default_kwargs` only, so share one instance built from them.
+        cls.md = markdown.Markdown(**cls.default_kwargs)
+
+    def assertMarkdownRenders(self, source, expected, expected_attrs=None, **kwargs):
+        """ Render with the shared instance unless a test overrides `default_kwargs` or checks attributes. """
+        if expected_attrs or kwargs:
+            return super().assertMarkdownRenders(source, expected, expected_attrs, **kwargs)
+        self.md.reset()
+        self.assertMultiLineEqual(self.md.convert(source), expected)
+
+    ROUNDTRIPS = (
+        ('raw_paragraph', '<p>A raw paragraph.</p>'),
+        ('raw_skip_inline_markdown', '<p>A *raw* paragraph.</p>'),
+        ('raw_empty', '<p></p>'),
+        ('raw_empty_space', '<p> </p>'),
+        ('raw_empty_newline', '<p>\n</p>'),
+        ('raw_empty_blank_line', '<p>\n\n</p>'),
+        ('raw_uppercase', '<DIV>*foo*</DIV>'),
+        ('nested_raw_one_line', '<div><p>*foo*</p></div>'),
+        ('nested_inline_one_line', '<p><em>foo</em><br></p>'),
+        ('raw_p_no_end_tag', '<p>*text*'),
+        ('raw_nested_p_no_end_tag', '<div><p>*text*</div>'),
+        (
+            'raw_attributes',
+            '<p id="foo", class="bar baz", style="margin: 15px; line-height: 1.5; text-align: center;">text</p>'
+        ),
+        ('raw_comment_one_line', '<!-- *foo* -->'),
+        ('raw_comment_one_line_with_tag', '<!-- <tag> -->'),
+        ('raw_processing_instruction_one_line', "<?php echo '>'; ?>"),
+        ('raw_declaration_one_line', '<!DOCTYPE html>'),
+        ('raw_cdata_one_line', '<![CDATA[ document.write(">"); ]]>'),
+        ('nested_charref', '<p>&sect;</p>'),
+        ('nested_entityref', '<p>&#167;</p>'),
+        ('startendtag', '<hr>'),
+        ('startendtag_with_attrs', '<hr id="foo" class="bar">'),
+        ('startendtag_with_space', '<hr >'),
+        ('closed_startendtag', '<hr />'),
+        ('closed_startendtag_without_space', '<hr/>'),
+        ('closed_startendtag_with_attrs', '<hr id="foo" class="bar" />'),
+        ('nested_startendtag', '<div><hr></div>'),
+        ('nested_closed_startendtag', '<div><hr /></div>'),
+    )
+    """ `(name, source)` pairs of raw HTML which must be output unchanged. """
+
+    def test_raw_roundtrips(self):
+        for name, source in self.ROUNDTRIPS:
+            with self.subTest(name=name):
+                self.assertMarkdownRenders(source, source)
 
     def test_raw_indent_one_space(self):
         self.assertMarkdownRenders(
@@ -85,36 +124,6 @@ class TestHTMLBlocks(TestCase):
             '<p><em>bar</em> <code>&lt;</code> <em>foo</em></p>'
         )
 
-    def test_raw_empty(self):
-        self.assertMarkdownRenders(
-            '<p></p>',
-            '<p></p>'
-        )
-
-    def test_raw_empty_space(self):
-        self.assertMarkdownRenders(
-            '<p> </p>',
-            '<p> </p>'
-        )
-
-    def test_raw_empty_newline(self):
-        self.assertMarkdownRenders(
-            '<p>\n</p>',
-            '<p>\n</p>'
-        )
-
-    def test_raw_empty_blank_line(self):
-        self.assertMarkdownRenders(
-            '<p>\n\n</p>',
-            '<p>\n\n</p>'
-        )
-
-    def test_raw_uppercase(self):
-        self.assertMarkdownRenders(
-            '<DIV>*foo*</DIV>',
-            '<DIV>*foo*</DIV>'
-        )
-
     def test_raw_uppercase_multiline(self):
         self.assertMarkdownRenders(
             self.dedent(
@@ -363,12 +372,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_nested_raw_one_line(self):
-        self.assertMarkdownRenders(
-            '<div><p>*foo*</p></div>',
-            '<div><p>*foo*</p></div>'
-        )
-
     def test_nested_raw_block(self):
         self.assertMarkdownRenders(
             self.dedent(
@@ -451,12 +454,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_nested_inline_one_line(self):
-        self.assertMarkdownRenders(
-            '<p><em>foo</em><br></p>',
-            '<p><em>foo</em><br></p>'
-        )
-
     def test_raw_nested_inline(self):
         self.assertMarkdownRenders(
             self.dedent(
@@ -598,12 +595,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_raw_p_no_end_tag(self):
-        self.assertMarkdownRenders(
-            '<p>*text*',
-            '<p>*text*'
-        )
-
     def test_raw_multiple_p_no_end_tag(self):
         self.assertMarkdownRenders(
             self.dedent(
@@ -640,12 +631,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_raw_nested_p_no_end_tag(self):
-        self.assertMarkdownRenders(
-            '<div><p>*text*</div>',
-            '<div><p>*text*</div>'
-        )
-
     def test_raw_open_bracket_only(self):
         self.assertMarkdownRenders(
             '<',
@@ -706,12 +691,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_raw_attributes(self):
-        self.assertMarkdownRenders(
-            '<p id="foo", class="bar baz", style="margin: 15px; line-height: 1.5; text-align: center;">text</p>',
-            '<p id="foo", class="bar baz", style="margin: 15px; line-height: 1.5; text-align: center;">text</p>'
-        )
-
     def test_raw_attributes_nested(self):
         self.assertMarkdownRenders(
             self.dedent(
@@ -734,18 +713,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_raw_comment_one_line(self):
-        self.assertMarkdownRenders(
-            '<!-- *foo* -->',
-            '<!-- *foo* -->'
-        )
-
-    def test_raw_comment_one_line_with_tag(self):
-        self.assertMarkdownRenders(
-            '<!-- <tag> -->',
-            '<!-- <tag> -->'
-        )
-
     def test_comment_in_code_span(self):
         self.assertMarkdownRenders(
             '`<!-- *foo* -->`',
@@ -1035,12 +1002,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_raw_processing_instruction_one_line(self):
-        self.assertMarkdownRenders(
-            "<?php echo '>'; ?>",
-            "<?php echo '>'; ?>"
-        )
-
     # This is a change in behavior and does not match the reference implementation.
     # We have no way to determine if text is on the same line, so we get this. TODO: reevaluate!
     def test_raw_processing_instruction_one_line_followed_by_text(self):
@@ -1137,12 +1098,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_raw_declaration_one_line(self):
-        self.assertMarkdownRenders(
-            '<!DOCTYPE html>',
-            '<!DOCTYPE html>'
-        )
-
     # This is a change in behavior and does not match the reference implementation.
     # We have no way to determine if text is on the same line, so we get this. TODO: reevaluate!
     def test_raw_declaration_one_line_followed_by_text(self):
@@ -1195,12 +1150,6 @@ class TestHTMLBlocks(TestCase):
             )
         )
 
-    def test_raw_cdata_one_line(self):
-        self.assertMarkdownRenders(
-            '<![CDATA[ document.write(">"); ]]>',
-            '<![CDATA[ document.write(">"); ]]>'
-        )
-
     # Note: this is a change. Neither previous output nor this match reference implementation.
     def test_raw_cdata_one_line_followed_by_text(self):
         self.assertMarkdownRenders(
@@ -1302,78 +1251,18 @@ class TestHTMLBlocks(TestCase):
             '<p>&sect;</p>'
         )
 
-    def test_nested_charref(self):
-        self.assertMarkdownRenders(
-            '<p>&sect;</p>',
-            '<p>&sect;</p>'
-        )
-
     def test_entityref(self):
         self.assertMarkdownRenders(
             '&#167;',
             '<p>&#167;</p>'
         )
 
-    def test_nested_entityref(self):
-        self.assertMarkdownRenders(
-            '<p>&#167;</p>',
-            '<p>&#167;</p>'
-        )
-
     def test_amperstand(self):
         self.assertMarkdownRenders(
             'AT&T & AT&amp;T',
             '<p>AT&amp;T &amp; AT&amp;T</p>'
         )
 
-    def test_startendtag(self):
-        self.assertMarkdownRenders(
-            '<hr>',
-            '<hr>'
-        )
-
-    def test_startendtag_with_attrs(self):
-        self.assertMarkdownRenders(
-            '<hr id="foo" class="bar">',
-            '<hr id="foo" class="bar">'
-        )
-
-    def test_startendtag_with_space(self):
-        self.assertMarkdownRenders(
-            '<hr >',
-            '<hr >'
-        )
-
-    def test_closed_startendtag(self):
-        self.assertMarkdownRenders(
-            '<hr />',
-            '<hr />'
-        )
-
-    def test_closed_startendtag_without_space(self):
-        self.assertMarkdownRenders(
-            '<hr/>',
-            '<hr/>'
-        )
-
-    def test_closed_startendtag_with_attrs(self):
-        self.assertMarkdownRenders(
-            '<hr id="foo" class="bar" />',
-            '<hr id="foo" class="bar" />'
-        )
-
-    def test_nested_startendtag(self):
-        self.assertMarkdownRenders(
-            '<div><hr></div>',
-            '<div><hr></div>'
-        )
-
-    def test_nested_closed_startendtag(self):
-        self.assertMarkdownRenders(
-            '<div><hr /></div>',
-            '<div><hr /></div>'
-        )
-
     def test_auto_links_dont_break_parser(self):
         self.assertMarkdownRenders(
             self.dedent(
@@ -20,9 +20,10 @@ Copyright 2004 Manfred Stienstra (the original version)
 License: BSD (see LICENSE.md for details).
 """
 
-from markdown.test_tools import TestCase
+from markdown.test_tools import TestCase, recursionlimit
 from markdown import Markdown
-from markdown.extensions.abbr import AbbrExtension
+from markdown.extensions.abbr import AbbrExtension, AbbrTreeprocessor
+import xml.etree.ElementTree as etree
 
 
 class TestAbbr(TestCase):
@@ -467,6 +468,25 @@ class TestAbbr(TestCase):
             )
         )
 
+    def test_abbr_shared_prefix(self):
+        self.assertMarkdownRenders(
+            self.dedent(
+                """
+                AB ABC ABCD ABX ABCX
+
+                *[AB]: Two
+                *[ABCD]: Four
+                *[ABX]: Three
+                """
+            ),
+            self.dedent(
+                """
+                <p><abbr title="Two">AB</abbr> ABC <abbr title="Four">ABCD</abbr> """
+                + """<abbr title="Three">ABX</abbr> ABCX</p>
+                """
+            )
+        )
+
     def test_abbr_empty(self):
         self.assertMarkdownRenders(
             self.dedent(
@@ -519,6 +539,38 @@ class TestAbbr(TestCase):
             )
         )
 
+    def test_abbr_glossary_empty_definition(self):
+        glossary = {'abbr': ''}
+        self.assertMarkdownRenders(
+            'abbr *foo* abbr',
+            '<p>abbr <em>foo</em> abbr</p>',
+            extensions=[AbbrExtension(glossary=glossary)]
+        )
+
+    def test_abbr_deeply_nested(self):
+        processor = AbbrTreeprocessor(abbrs={'abbr': 'Abbreviation'})
+        root = el = etree.Element('div')
+        for _ in range(200):
+            el = etree.SubElement(el, 'span')
+            el.tail = 'abbr'
+        el.text = 'abbr'
+        with recursionlimit(50):
+            processor.run(root)
+        self.assertEqual(len(root.findall('.//abbr')), 201)
+
+    def test_abbr_very_long(self):
+        abbr = 'A' * 1000
+        self.assertMarkdownRenders(
+            f'x {abbr}\n\n*[{abbr}]: Long',
+            f'<p>x <abbr title="Long">{abbr}</abbr></p>'
+        )
+
+    def test_abbr_many_nested_prefixes(self):
+        abbrs = {'A' * length: str(length) for length in range(1, 1001)}
+        md = Markdown(extensions=[AbbrExtension(glossary=abbrs)])
+        self.assertEqual(md.convert('A' * 1000), f'<p><abbr title="1000">{"A" * 1000}</abbr></p>')
+        self.assertEqual(md.convert('x AAA x'), '<p>x <abbr title="3">AAA</abbr> x</p>')
+
     def test_abbr_reset(self):
         ext = AbbrExtension()
         md = Markdown(extensions=[ext])
@@ -530,3 +582,27 @@ class TestAbbr(TestCase):
         self.assertEqual(ext.abbrs, {})
         md.convert('*[foo]: Foo Definition')
         self.assertEqual(ext.abbrs, {'foo': 'Foo Definition'})
+
+    def test_abbr_regex_cache(self):
+        ext = AbbrExtension(glossary={'ABBR': 'Abbreviation'})
+        md = Markdown(extensions=[ext])
+        processor = md.treeprocessors['abbr']
+        self.assertEqual(md.convert('ABBR'), '<p><abbr title="Abbreviation">ABBR</abbr></p>')
+        regex = processor.RE
+        md.reset()
+        self.assertEqual(md.convert('ABBR'), '<p><abbr title="Abbreviation">ABBR</abbr></p>')
+        self.assertIs(processor.RE, regex)
+        md.reset()
+        self.assertEqual(
+            md.convert('ABBR foo\n\n*[foo]: Foo Definition'),
+            '<p><abbr title="Abbreviation">ABBR</abbr> <abbr title="Foo Definition">foo</abbr></p>'
+        )
+        self.assertIsNot(processor.RE, regex)
+
+    def test_abbr_regex_shared(self):
+        glossary = {'ABBR': 'Abbreviation'}
+        md1 = Markdown(extensions=[AbbrExtension(glossary=glossary)])
+        md2 = Markdown(extensions=[AbbrExtension(glossary=glossary)])
+        md1.convert('ABBR')
+        md2.convert('ABBR')
+        self.assertIs(md1.treeprocessors['abbr'].RE, md2.treeprocessors['abbr'].RE)
@@ -24,6 +24,7 @@ from unittest import TestSuite
 from markdown.test_tools import TestCase
 from ..blocks.test_html_blocks import TestHTMLBlocks
 from markdown import Markdown
+from markdown.extensions.md_in_html import MarkdownInHTMLPostprocessor
 from xml.etree.ElementTree import Element
 
 
@@ -45,6 +46,9 @@ class TestDefaultwMdInHTML(TestHTMLBlocks):
 
     default_kwargs = {'extensions': ['md_in_html']}
 
+    def test_md_in_html_loaded(self):
+        self.assertIsInstance(self.md.postprocessors['raw_html'], MarkdownInHTMLPostprocessor)
+
 
 class TestMdInHTML(TestCase):
 